@@ -1,6 +1,7 @@
 import logging
 import uuid
 from decimal import Decimal
+from functools import lru_cache
 
 import razorpay
 import razorpay.errors
@@ -70,10 +71,20 @@ def clean_razorpay_response(response: dict):
     response["amount"] = Decimal(response["amount"]) / 100
 
 
+@lru_cache(maxsize=16)
+def _get_cached_client(public_key: str, private_key: str):
+    return razorpay.Client(auth=(public_key, private_key))
+
+
 def get_client(public_key: str, private_key: str, **_):
-    """Create a Razorpay client from set-up application keys."""
-    razorpay_client = razorpay.Client(auth=(public_key, private_key))
-    return razorpay_client
+    """Return a cached Razorpay client for the given application keys.
+
+    Clients are shared process-wide, so the HTTP session of the client and its
+    pooled connections are reused across payment requests. The client only sends
+    stateless API calls through a session backed by urllib3's thread-safe
+    connection pool, so it can be shared between worker threads.
+    """
+    return _get_cached_client(public_key, private_key)
 
 
 def get_client_token(**_):
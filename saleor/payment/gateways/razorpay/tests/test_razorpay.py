@@ -1,3 +1,4 @@
+import threading
 from decimal import Decimal
 from unittest.mock import patch
 
@@ -8,6 +9,7 @@ from .... import ChargeStatus, TransactionKind
 from ....interface import GatewayConfig
 from ....utils import create_payment_information
 from .. import (
+    _get_cached_client,
     capture,
     check_payment_supported,
     clean_razorpay_response,
@@ -22,6 +24,13 @@ from .. import (
 TRANSACTION_AMOUNT = Decimal("61.33")
 
 
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    _get_cached_client.cache_clear()
+    yield
+    _get_cached_client.cache_clear()
+
+
 @pytest.fixture
 def gateway_config():
     return GatewayConfig(
@@ -97,6 +106,70 @@ def test_get_client(mocked_gateway, gateway_config):
     mocked_gateway.assert_called_once_with(auth=("public", "secret"))
 
 
+@patch("razorpay.Client")
+def test_get_client_reuses_client_for_same_keys(mocked_gateway, gateway_config):
+    # given
+    first_client = get_client(**gateway_config.connection_params)
+
+    # when
+    second_client = get_client(**gateway_config.connection_params)
+
+    # then
+    assert first_client is second_client
+    mocked_gateway.assert_called_once_with(auth=("public", "secret"))
+
+
+@patch("razorpay.Client")
+def test_get_client_ignores_store_params_in_cache_key(mocked_gateway, gateway_config):
+    # given
+    first_client = get_client(**gateway_config.connection_params)
+    connection_params = {**gateway_config.connection_params, "store_name": "Other"}
+
+    # when
+    second_client = get_client(**connection_params)
+
+    # then
+    assert first_client is second_client
+    mocked_gateway.assert_called_once_with(auth=("public", "secret"))
+
+
+@patch("razorpay.Client")
+def test_get_client_reuses_client_across_threads(mocked_gateway, gateway_config):
+    # given
+    main_thread_client = get_client(**gateway_config.connection_params)
+    other_thread_clients = []
+
+    # when
+    thread = threading.Thread(
+        target=lambda: other_thread_clients.append(
+            get_client(**gateway_config.connection_params)
+        )
+    )
+    thread.start()
+    thread.join()
+
+    # then
+    assert other_thread_clients[0] is main_thread_client
+    mocked_gateway.assert_called_once_with(auth=("public", "secret"))
+
+
+@patch("razorpay.Client")
+def test_get_client_uses_separate_client_for_different_keys(
+    mocked_gateway, gateway_config
+):
+    # given
+    mocked_gateway.side_effect = lambda auth: object()
+    first_client = get_client(**gateway_config.connection_params)
+    connection_params = {**gateway_config.connection_params, "private_key": "other"}
+
+    # when
+    second_client = get_client(**connection_params)
+
+    # then
+    assert first_client is not second_client
+    assert mocked_gateway.call_count == 2
+
+
 def test_get_client_token():
     assert get_client_token()
 